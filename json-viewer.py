@@ -49,56 +49,90 @@ import os
 import textwrap
 import csv
 import hashlib
+import math
 
 # Helper to load JSON file (list of objects or one object per line)
 def load_json_file(filename):
     with open(filename, 'r') as f:
-        try:
-            data = json.load(f)
-            if isinstance(data, dict):
-                data = [data]
-        except json.JSONDecodeError:
-            # Try line-delimited JSON
-            f.seek(0)
-            data = [json.loads(line) for line in f if line.strip()]
+        # Peek at the first non-blank line to tell line-delimited JSON apart from a
+        # single document, so ndjson is parsed in one streaming pass
+        first = f.readline()
+        while first and not first.strip():
+            first = f.readline()
+        if not first:
+            return []
+        if first.lstrip().startswith('{'):
+            try:
+                row = json.loads(first)
+            except json.JSONDecodeError:
+                row = None  # An object spread over several lines
+            if row is not None:
+                data = [row]
+                append = data.append
+                loads = json.loads
+                for line in f:
+                    if line.strip():
+                        append(loads(line))
+                return data
+        f.seek(0)
+        data = json.load(f)
+        if isinstance(data, dict):
+            data = [data]
     return data
 
-def get_column_widths(data, columns, max_width, screen_width):
+def build_columns(data, columns):
+    # Columnar copy of the data: one list of display strings per column, indexed
+    # by row number, so filtering and rendering never touch the row dicts. Short
+    # values are interned so repeated ones (statuses, categories...) share a string
+    intern = sys.intern
+    cols = {}
+    for col in columns:
+        values = [str(row.get(col, '')) for row in data]
+        cols[col] = [intern(val) if len(val) < 64 else val for val in values]
+    return cols
+
+def get_column_widths(cols, rows, columns, max_width, screen_width):
     widths = [len(col) for col in columns]
-    for row in data:
+    if rows:
         for i, col in enumerate(columns):
-            val = str(row.get(col, ''))
-            widths[i] = min(max(widths[i], len(val)), max_width)
+            values = cols[col]
+            longest = max(len(values[r]) for r in rows)
+            widths[i] = min(max(widths[i], longest), max_width)
     total_width = sum(widths) + len(widths) - 1
     if total_width > screen_width:
         scale = (screen_width - len(widths) + 1) / sum(widths)
         widths = [max(3, int(w * scale)) for w in widths]
         while sum(widths) + len(widths) - 1 > screen_width:
-            max_idx = widths.index(max(widths))
+            max_idx = max(range(len(widths)), key=widths.__getitem__)
             if widths[max_idx] > 3:
                 widths[max_idx] -= 1
             else:
                 break
     return widths
 
-def render_table(data, columns, start_row, num_rows, max_width, screen_width):
-    visible_rows = data[start_row:start_row + num_rows]
-    col_widths = get_column_widths(data, columns, max_width, screen_width)
-    header = ' '.join(col.ljust(col_widths[i])[:col_widths[i]] for i, col in enumerate(columns))
+def render_table(cols, rows, columns, start_row, num_rows, max_width, screen_width, col_widths=None):
+    visible_rows = rows[start_row:start_row + num_rows]
+    if col_widths is None:
+        col_widths = get_column_widths(cols, rows, columns, max_width, screen_width)
+    # '<w.w' pads and truncates each cell to its column width in one step
+    col_formats = [f'<{w}.{w}' for w in col_widths]
+    header = ' '.join(format(col, col_formats[i]) for i, col in enumerate(columns))
     lines = [header]
-    for row in visible_rows:
-        line = ' '.join(str(row.get(col, '')).ljust(col_widths[i])[:col_widths[i]] for i, col in enumerate(columns))
+    col_values = [cols[col] for col in columns]
+    for r in visible_rows:
+        line = ' '.join(format(values[r], fmt) for values, fmt in zip(col_values, col_formats))
         lines.append(line)
     return lines
 
 def column_menu(stdscr, all_columns, visible_columns, prompt="Toggle columns (space/enter to toggle, q/esc to exit):"):
     curses.curs_set(0)
     selected = 0
+    visible_set = set(visible_columns)  # Kept in sync with visible_columns for O(1) lookups
     while True:
-        stdscr.clear()
+        stdscr.erase()
         stdscr.addstr(0, 0, prompt)
         for idx, col in enumerate(all_columns):
-            marker = '[x]' if col in visible_columns else '[ ]'
+            marker = '[x]' if col in visible_set else '[ ]'
             highlight = curses.A_REVERSE if idx == selected else 0
             stdscr.addstr(idx+1, 0, f"{marker} {col}", highlight)
         key = stdscr.getch()
@@ -110,18 +144,20 @@ def column_menu(stdscr, all_columns, visible_columns, prompt="Toggle columns (sp
             selected = (selected - 1) % len(all_columns)
         elif key in (ord(' '), ord('\n'), ord('\r')):
             col = all_columns[selected]
-            if col in visible_columns:
+            if col in visible_set:
                 if len(visible_columns) > 1:
                     visible_columns.remove(col)
+                    visible_set.discard(col)
             else:
                 visible_columns.append(col)
+                visible_set.add(col)
     return visible_columns
 
 def sort_menu(stdscr, columns, current_col, ascending):
     curses.curs_set(0)
     selected = columns.index(current_col) if current_col in columns else 0
     while True:
-        stdscr.clear()
+        stdscr.erase()
         stdscr.addstr(0, 0, f"Sort by column (s to toggle asc/desc, q/esc to exit): {'ASC' if ascending else 'DESC'}")
         for idx, col in enumerate(columns):
             marker = '->' if idx == selected else '  '
@@ -141,7 +177,7 @@ def sort_menu(stdscr, columns, current_col, ascending):
 
 def filter_prompt(stdscr, current_filter):
     curses.curs_set(1)
-    stdscr.clear()
+    stdscr.erase()
     stdscr.addstr(0, 0, "Enter filter keyword (Esc to clear): ")
     stdscr.addstr(1, 0, current_filter)
     stdscr.refresh()
@@ -168,30 +204,44 @@ def filter_prompt(stdscr, current_filter):
     curses.curs_set(0)
     return filter_str
 
-def filter_data(data, visible_columns, filter_str):
+def build_search_blobs(cols, columns):
+    # One lowercase string per row covering the given columns; values are joined
+    # with a newline, which the filter prompt can never contain, so a match can't
+    # straddle two columns
+    return ['\n'.join(values).lower() for values in zip(*(cols[col] for col in columns))]
+
+def filter_data(rows, search_blobs, filter_str):
     if not filter_str:
-        return data
+        return rows
     filter_str = filter_str.lower()
-    filtered = []
-    for row in data:
-        for col in visible_columns:
-            val = str(row.get(col, '')).lower()
-            if filter_str in val:
-                filtered.append(row)
-                break
-    return filtered
+    return [r for r in rows if filter_str in search_blobs[r]]
 
-def sort_data(data, sort_col, ascending):
-    if not sort_col:
-        return data
+def build_sort_keys(data, sort_col):
+    # One key per row. Raw values (not the display strings) so numbers compare as
+    # numbers, and a column made up entirely of numeric strings sorts numerically
+    keys = [row.get(sort_col, '') for row in data]
+    # Only plain finite numbers count: float() also takes 'NaN'/'inf' (which
+    # scramble the sort order), '1_000' and surrounding whitespace
+    if all(isinstance(key, str) and key == key.strip() and '_' not in key for key in keys):
+        try:
+            numbers = [float(key) for key in keys]
+        except ValueError:
+            return keys
+        if all(math.isfinite(number) for number in numbers):
+            return numbers
+    return keys
+
+def sort_data(rows, sort_keys, ascending):
+    if sort_keys is None:
+        return rows
     try:
-        return sorted(data, key=lambda r: r.get(sort_col, ''), reverse=not ascending)
+        return sorted(rows, key=sort_keys.__getitem__, reverse=not ascending)
     except Exception:
-        return data
+        return rows
 
 def export_prompt(stdscr, default_filename):
     curses.curs_set(1)
-    stdscr.clear()
+    stdscr.erase()
     stdscr.addstr(0, 0, f"Export to SQLite3 file (enter filename): ")
     stdscr.addstr(1, 0, default_filename)
     stdscr.refresh()
@@ -207,21 +257,24 @@ def export_to_sqlite3(filename, columns, data):
     if os.path.exists(filename):
         os.remove(filename)
     conn = sqlite3.connect(filename)
+    # The file is a fresh throwaway export, so skip journaling and fsyncs
+    conn.execute('PRAGMA journal_mode=OFF')
+    conn.execute('PRAGMA synchronous=OFF')
     cur = conn.cursor()
     # Create table
     col_defs = ', '.join(f'"{col}" TEXT' for col in columns)
     cur.execute(f'CREATE TABLE json_data ({col_defs})')
-    # Insert data
-    for row in data:
-        values = [str(row.get(col, '')) for col in columns]
-        placeholders = ', '.join('?' for _ in columns)
-        cur.execute(f'INSERT INTO json_data VALUES ({placeholders})', values)
+    # Insert data in a single transaction
+    placeholders = ', '.join('?' for _ in columns)
+    cur.execute('BEGIN')
+    cur.executemany(f'INSERT INTO json_data VALUES ({placeholders})',
+                    ([str(row.get(col, '')) for col in columns] for row in data))
     conn.commit()
     conn.close()
 
 def export_csv_prompt(stdscr, default_filename):
     curses.curs_set(1)
-    stdscr.clear()
+    stdscr.erase()
     stdscr.addstr(0, 0, f"Export to CSV file (enter filename): ")
     stdscr.addstr(1, 0, default_filename)
     stdscr.refresh()
@@ -234,34 +287,50 @@ def export_csv_prompt(stdscr, default_filename):
     return filename
 
 def export_to_csv(filename, columns, data):
-    with open(filename, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore')
-        writer.writeheader()
-        for row in data:
-            writer.writerow({col: row.get(col, '') for col in columns})
+    with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        writer.writerows([row.get(col, '') for col in columns] for row in data)
+
+_wrap_cache = {}  # (id(row), width) -> wrapped lines, rows live as long as the viewer
 
 def row_details_popup(stdscr, row):
     curses.curs_set(0)
     height, width = stdscr.getmaxyx()
-    # Format JSON pretty
-    json_str = json.dumps(row, indent=2, ensure_ascii=False)
-    lines = json_str.splitlines()
-    # Wrap lines that are too long
-    wrapped_lines = []
-    for line in lines:
-        wrapped_lines.extend(textwrap.wrap(line, width-2) or [''])
+    # Wrapping a large row is slow, so keep it for the next time the row is opened
+    cache_key = (id(row), width)
+    wrapped_lines = _wrap_cache.get(cache_key)
+    if wrapped_lines is None:
+        # Format JSON pretty
+        json_str = dumps_pretty(row)
+        lines = json_str.splitlines()
+        # Wrap lines that are too long
+        wrapped_lines = []
+        for line in lines:
+            wrapped_lines.extend(textwrap.wrap(line, width-2) or [''])
+        _wrap_cache[cache_key] = wrapped_lines
     total_lines = len(wrapped_lines)
     start = 0
+    redraw = True
+    # Scroll the body region by one line on Up/Down and only paint the line that
+    # scrolled in, rather than repainting the whole window every key
+    try:
+        stdscr.setscrreg(1, height-2)
+        can_scroll = True
+    except curses.error:
+        can_scroll = False
     while True:
-        stdscr.clear()
-        stdscr.addstr(0, 0, "Row Details (q/Esc to exit, Up/Down to scroll)", curses.A_BOLD)
-        for idx in range(1, height-1):
-            line_idx = start + idx - 1
-            if 0 <= line_idx < total_lines:
-                try:
-                    stdscr.addnstr(idx, 0, wrapped_lines[line_idx], width-1)
-                except curses.error:
-                    pass
+        if redraw:
+            stdscr.erase()
+            stdscr.addstr(0, 0, "Row Details (q/Esc to exit, Up/Down to scroll)", curses.A_BOLD)
+            for idx in range(1, height-1):
+                line_idx = start + idx - 1
+                if 0 <= line_idx < total_lines:
+                    try:
+                        stdscr.addnstr(idx, 0, wrapped_lines[line_idx], width-1)
+                    except curses.error:
+                        pass
+            redraw = False
         stdscr.refresh()
         key = stdscr.getch()
         if key in (ord('q'), 27):
@@ -269,9 +338,31 @@ def row_details_popup(stdscr, row):
         elif key == curses.KEY_DOWN:
             if start < total_lines - (height - 2):
                 start += 1
+                if can_scroll:
+                    stdscr.scrollok(True)
+                    stdscr.scroll(1)
+                    stdscr.scrollok(False)
+                    try:
+                        stdscr.addnstr(height-2, 0, wrapped_lines[start + height - 3], width-1)
+                    except curses.error:
+                        pass
+                else:
+                    redraw = True
         elif key == curses.KEY_UP:
             if start > 0:
                 start -= 1
+                if can_scroll:
+                    stdscr.scrollok(True)
+                    stdscr.scroll(-1)
+                    stdscr.scrollok(False)
+                    try:
+                        stdscr.addnstr(1, 0, wrapped_lines[start], width-1)
+                    except curses.error:
+                        pass
+                else:
+                    redraw = True
+    if can_scroll:
+        stdscr.setscrreg(0, height-1)
 
 try:
     import pyperclip
@@ -279,16 +370,60 @@ try:
 except ImportError:
     HAS_PYPERCLIP = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+def has_non_finite(value):
+    # True if a parsed JSON value contains NaN/Infinity anywhere, which orjson
+    # would silently write out as null
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(has_non_finite(v) for v in value.values())
+    if isinstance(value, list):
+        return any(has_non_finite(v) for v in value)
+    return False
+
+def dumps_sorted(row):
+    # Canonical JSON bytes for a row (orjson when available, it is much faster)
+    if HAS_ORJSON:
+        try:
+            out = orjson.dumps(row, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            out = None  # e.g. integers wider than 64 bits, which json handles
+        # Non-finite floats always come out as null, so only rows with a null
+        # need the (slow) check
+        if out is not None and (b'null' not in out or not has_non_finite(row)):
+            return out
+    return json.dumps(row, sort_keys=True, ensure_ascii=False).encode('utf-8')
+
+def dumps_pretty(row):
+    # Indented JSON for display and copying. Runs once per popup or copy, so the
+    # stdlib is fast enough and keeps NaN/Infinity as they were in the file
+    return json.dumps(row, indent=2, ensure_ascii=False)
+
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
 def row_hash(row):
-    # Use a hash of the JSON string as a unique identifier
-    return hashlib.md5(json.dumps(row, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+    # Use a hash of the JSON string as a unique identifier. It is only compared in
+    # memory, so a fast 64-bit integer hash is enough (xxhash, else blake2b)
+    if HAS_XXHASH:
+        return xxhash.xxh64(dumps_sorted(row)).intdigest()
+    return int.from_bytes(hashlib.blake2b(dumps_sorted(row), digest_size=8).digest(), 'little')
 
 def reorder_columns_menu(stdscr, columns):
     curses.curs_set(0)
     cols = columns.copy()
     selected = 0
     while True:
-        stdscr.clear()
+        stdscr.erase()
         stdscr.addstr(0, 0, "Reorder columns (Up/Down: select, Left/Right: move, Enter: confirm, q/Esc: cancel)")
         for idx, col in enumerate(cols):
             highlight = curses.A_REVERSE if idx == selected else 0
@@ -315,10 +450,13 @@ def command_palette(stdscr, commands):
     curses.curs_set(1)
     filter_str = ''
     selected = 0
+    # Lowercase the searchable fields once rather than on every keystroke
+    commands_lc = [(name.lower(), desc.lower()) for name, desc, _ in commands]
     while True:
-        stdscr.clear()
+        stdscr.erase()
         stdscr.addstr(0, 0, "Command Palette (type to search, Enter: run, q/Esc: cancel)", curses.A_BOLD)
-        filtered = [cmd for cmd in commands if filter_str.lower() in cmd[0].lower() or filter_str.lower() in cmd[1].lower()]
+        fs = filter_str.lower()
+        filtered = [cmd for cmd, (name_lc, desc_lc) in zip(commands, commands_lc) if fs in name_lc or fs in desc_lc]
         for idx, (name, desc, _) in enumerate(filtered[:20]):
             highlight = curses.A_REVERSE if idx == selected else 0
             stdscr.addstr(idx+1, 0, f"{name:12} {desc}", highlight)
@@ -343,6 +481,21 @@ def command_palette(stdscr, commands):
             filter_str += chr(key)
             selected = 0
 
+NAV_KEYS = (curses.KEY_UP, curses.KEY_DOWN, curses.KEY_NPAGE, curses.KEY_PPAGE)
+
+def move_selection(key, selected_row, total_rows, page_size):
+    if key == curses.KEY_DOWN:
+        if selected_row < total_rows - 1:
+            selected_row += 1
+    elif key == curses.KEY_UP:
+        if selected_row > 0:
+            selected_row -= 1
+    elif key == curses.KEY_NPAGE:  # Page Down
+        selected_row = min(selected_row + page_size, total_rows - 1)
+    elif key == curses.KEY_PPAGE:  # Page Up
+        selected_row = max(selected_row - page_size, 0)
+    return selected_row
+
 def main(stdscr, filename):
     curses.curs_set(0)
     curses.start_color()
@@ -356,83 +509,146 @@ def main(stdscr, filename):
         stdscr.addstr(0, 0, "No data loaded.")
         stdscr.getch()
         return
+    # Rows are never mutated, so hash each one once up front
+    row_hashes = [row_hash(row) for row in data]
     all_columns = list(data[0].keys())
+    cols = build_columns(data, all_columns)
     visible_columns = all_columns.copy()
     start_row = 0
-    selected_row = 0  # Index in the filtered/sorted data
+    selected_row = 0  # Index into view
     filter_str = ''
     sort_col = None
     ascending = True
     bookmarks = set()
     show_only_bookmarks = False
+    bookmarks_version = 0  # Bumped whenever bookmarks change
+    view_key = None
+    view = []  # Indices into data of the filtered/sorted rows
+    search_blobs = []
+    blob_columns = None  # Columns search_blobs was built from
+    filtered = range(len(data))
+    filtered_by = None  # (lowercased filter, blob_columns) that produced filtered
+    sort_keys = None
+    sort_keys_col = None  # Column sort_keys was built from
+    widths_key = None
+    col_widths = []
+    # What is currently painted, so pure cursor moves only repaint two rows
+    last_frame_key = None
+    last_selected = None
+    table_lines = []
+    table_marks = []
     while True:
-        # Filter and sort data
-        filtered_data = filter_data(data, visible_columns, filter_str)
-        sorted_data = sort_data(filtered_data, sort_col, ascending)
-        # If show_only_bookmarks is enabled, filter to only bookmarked rows
-        if show_only_bookmarks:
-            sorted_data = [row for row in sorted_data if row_hash(row) in bookmarks]
+        # Filter and sort data, but only when something affecting the view changed
+        # Bookmarks only change which rows are shown in bookmarks-only mode
+        new_key = (filter_str, sort_col, ascending, show_only_bookmarks, tuple(visible_columns),
+                   bookmarks_version if show_only_bookmarks else None)
+        if new_key != view_key:
+            if filter_str and blob_columns != frozenset(visible_columns):
+                search_blobs = build_search_blobs(cols, visible_columns)
+                blob_columns = frozenset(visible_columns)
+            # A filter that extends the previous one can only match rows that already
+            # matched, so narrow the previous result instead of rescanning everything
+            fs = filter_str.lower()
+            if not fs:
+                filtered = range(len(data))
+                filtered_by = None
+            elif filtered_by != (fs, blob_columns):
+                if filtered_by and filtered_by[1] == blob_columns and filtered_by[0] in fs:
+                    candidates = filtered
+                else:
+                    candidates = range(len(data))
+                filtered = filter_data(candidates, search_blobs, filter_str)
+                filtered_by = (fs, blob_columns)
+            if sort_col and sort_col != sort_keys_col:
+                sort_keys = build_sort_keys(data, sort_col)
+                sort_keys_col = sort_col
+            view = sort_data(filtered, sort_keys if sort_col else None, ascending)
+            # If show_only_bookmarks is enabled, filter to only bookmarked rows
+            if show_only_bookmarks:
+                view = [r for r in view if row_hashes[r] in bookmarks]
+            view_key = new_key
         # Clamp selected_row and start_row
-        selected_row = max(0, min(selected_row, len(sorted_data)-1))
+        selected_row = max(0, min(selected_row, len(view)-1))
         height, width = stdscr.getmaxyx()
         num_rows = height - 2
         if selected_row < start_row:
             start_row = selected_row
         elif selected_row >= start_row + num_rows:
             start_row = selected_row - num_rows + 1
-        table_lines = []
-        col_widths = get_column_widths(sorted_data, visible_columns, 40, width-2)
-        header = ' '.join(col.ljust(col_widths[i])[:col_widths[i]] for i, col in enumerate(visible_columns))
-        table_lines.append('  ' + header)
-        for idx, row in enumerate(sorted_data[start_row:start_row+num_rows]):
-            mark = '*' if row_hash(row) in bookmarks else ' '
-            line = ' '.join(str(row.get(col, '')).ljust(col_widths[i])[:col_widths[i]] for i, col in enumerate(visible_columns))
-            table_lines.append(f'{mark} {line}')
-        stdscr.clear()
-        for idx, line in enumerate(table_lines):
-            if idx >= height - 1:
-                break
-            try:
+        # Widths scan the whole view, so only recompute them when it or the screen changes
+        if (view_key, width) != widths_key:
+            col_widths = get_column_widths(cols, view, visible_columns, 40, width-2)
+            widths_key = (view_key, width)
+        frame_key = (view_key, start_row, height, width)
+        if frame_key != last_frame_key:
+            # Bookmark marks are kept apart from the row text and drawn as their own
+            # two-character cell, so rows never need to be re-joined with them
+            table_lines = render_table(cols, view, visible_columns, start_row, num_rows, 40, width-2, col_widths)
+            table_marks = ['  '] + ['* ' if row_hashes[r] in bookmarks else '  ' for r in view[start_row:start_row+num_rows]]
+            stdscr.erase()
+            for idx, line in enumerate(table_lines):
+                if idx >= height - 1:
+                    break
                 if idx == 0:
-                    stdscr.addnstr(idx, 0, line, width-1, curses.color_pair(1) | curses.A_BOLD)
+                    attr = curses.color_pair(1) | curses.A_BOLD
                 elif start_row + (idx-1) == selected_row:
-                    stdscr.addnstr(idx, 0, line, width-1, curses.color_pair(2))
+                    attr = curses.color_pair(2)
                 else:
-                    stdscr.addnstr(idx, 0, line, width-1)
+                    attr = 0
+                try:
+                    stdscr.addnstr(idx, 0, table_marks[idx], 2, attr)
+                    stdscr.addnstr(idx, 2, line, width-3, attr)
+                except curses.error:
+                    pass
+            # Help bar (double height)
+            help_items = [
+                '/ Filter', 'r Reset', 's Sort', 'h Hide', 'o Reorder', 'e Export sqlite', 'x Export CSV',
+                'c Copy', 'b Bookmark', 'B Next bm', 'm Show bm', 'd/Enter Details', ': Cmd palette', 'q Quit'
+            ]
+            help_line = ''
+            help_lines = []
+            for item in help_items:
+                if len(help_line) + len(item) + 2 > width-1:
+                    help_lines.append(help_line.rstrip())
+                    help_line = ''
+                help_line += item + '  '
+            if help_line:
+                help_lines.append(help_line.rstrip())
+            # Ensure exactly two lines (pad if needed)
+            while len(help_lines) < 2:
+                help_lines.insert(0, '')
+            # Status/help line (bottom line)
+            status = ''
+            if filter_str:
+                status += f"[Filter: {filter_str}]  "
+            if sort_col:
+                status += f"[Sort: {sort_col} {'ASC' if ascending else 'DESC'}]  "
+            if show_only_bookmarks:
+                status += "[Bookmarks only]  "
+            status = status.rstrip()
+            try:
+                stdscr.addnstr(height-2, 0, help_lines[-2], width-1, curses.A_DIM)
+                stdscr.addnstr(height-1, 0, help_lines[-1] if not status else status, width-1, curses.A_BOLD)
             except curses.error:
                 pass
-        # Help bar (double height)
-        help_items = [
-            '/ Filter', 'r Reset', 's Sort', 'h Hide', 'o Reorder', 'e Export sqlite', 'x Export CSV',
-            'c Copy', 'b Bookmark', 'B Next bm', 'm Show bm', 'd/Enter Details', ': Cmd palette', 'q Quit'
-        ]
-        help_line = ''
-        help_lines = []
-        for item in help_items:
-            if len(help_line) + len(item) + 2 > width-1:
-                help_lines.append(help_line.rstrip())
-                help_line = ''
-            help_line += item + '  '
-        if help_line:
-            help_lines.append(help_line.rstrip())
-        # Ensure exactly two lines (pad if needed)
-        while len(help_lines) < 2:
-            help_lines.insert(0, '')
-        # Status/help line (bottom line)
-        status = ''
-        if filter_str:
-            status += f"[Filter: {filter_str}]  "
-        if sort_col:
-            status += f"[Sort: {sort_col} {'ASC' if ascending else 'DESC'}]  "
-        if show_only_bookmarks:
-            status += "[Bookmarks only]  "
-        status = status.rstrip()
-        try:
-            stdscr.addnstr(height-2, 0, help_lines[-2], width-1, curses.A_DIM)
-            stdscr.addnstr(height-1, 0, help_lines[-1] if not status else status, width-1, curses.A_BOLD)
-        except curses.error:
-            pass
+            last_frame_key = frame_key
+        elif selected_row != last_selected:
+            # Only the highlight moved: repaint the previous and new selected rows
+            for row_idx, attr in ((last_selected, 0), (selected_row, curses.color_pair(2))):
+                idx = row_idx - start_row + 1
+                if 1 <= idx < min(len(table_lines), height - 2):
+                    try:
+                        stdscr.addnstr(idx, 0, table_marks[idx], 2, attr)
+                        stdscr.addnstr(idx, 2, table_lines[idx], width-3, attr)
+                    except curses.error:
+                        pass
+        last_selected = selected_row
+        stdscr.noutrefresh()
+        curses.doupdate()
         key = stdscr.getch()
+        if key not in NAV_KEYS:
+            # Anything else may draw over the table (menus, prompts, popups)
+            last_frame_key = None
         if key == ord(':'):
             # Command palette
             commands = [
@@ -485,45 +701,46 @@ def main(stdscr, filename):
                     visible_columns = reorder_columns_menu(stdscr, visible_columns)
                 elif result == 'export_sqlite':
                     filename = export_prompt(stdscr, 'export.sqlite3')
-                    export_to_sqlite3(filename, visible_columns, sorted_data)
-                    stdscr.clear()
+                    export_to_sqlite3(filename, visible_columns, [data[r] for r in view])
+                    stdscr.erase()
                     stdscr.addstr(0, 0, f"Exported to {filename}")
                     stdscr.addstr(1, 0, "Press any key to continue...")
                     stdscr.getch()
                 elif result == 'export_csv':
                     filename = export_csv_prompt(stdscr, 'export.csv')
-                    export_to_csv(filename, visible_columns, sorted_data)
-                    stdscr.clear()
+                    export_to_csv(filename, visible_columns, [data[r] for r in view])
+                    stdscr.erase()
                     stdscr.addstr(0, 0, f"Exported to {filename}")
                     stdscr.addstr(1, 0, "Press any key to continue...")
                     stdscr.getch()
                 elif result == 'copy_row':
-                    if 0 <= selected_row < len(sorted_data):
+                    if 0 <= selected_row < len(view):
                         if HAS_PYPERCLIP:
-                            pyperclip.copy(json.dumps(sorted_data[selected_row], indent=2, ensure_ascii=False))
-                            stdscr.clear()
+                            pyperclip.copy(dumps_pretty(data[view[selected_row]]))
+                            stdscr.erase()
                             stdscr.addstr(0, 0, "Row copied to clipboard!")
                             stdscr.addstr(1, 0, "Press any key to continue...")
                             stdscr.getch()
                         else:
-                            stdscr.clear()
+                            stdscr.erase()
                             stdscr.addstr(0, 0, "pyperclip not installed. Run 'pip install pyperclip' and try again.")
                             stdscr.addstr(1, 0, "Press any key to continue...")
                             stdscr.getch()
                 elif result == 'bookmark':
-                    if 0 <= selected_row < len(sorted_data):
-                        h = row_hash(sorted_data[selected_row])
+                    if 0 <= selected_row < len(view):
+                        h = row_hashes[view[selected_row]]
                         if h in bookmarks:
                             bookmarks.remove(h)
                         else:
                             bookmarks.add(h)
+                        bookmarks_version += 1
                 elif result == 'next_bookmark':
-                    if bookmarks and len(sorted_data) > 0:
-                        current = row_hash(sorted_data[selected_row]) if 0 <= selected_row < len(sorted_data) else None
+                    if bookmarks and len(view) > 0:
+                        current = row_hashes[view[selected_row]] if 0 <= selected_row < len(view) else None
                         found = False
-                        for offset in range(1, len(sorted_data)+1):
-                            idx = (selected_row + offset) % len(sorted_data)
-                            if row_hash(sorted_data[idx]) in bookmarks:
+                        for offset in range(1, len(view)+1):
+                            idx = (selected_row + offset) % len(view)
+                            if row_hashes[view[idx]] in bookmarks:
                                 selected_row = idx
                                 found = True
                                 break
@@ -532,23 +749,23 @@ def main(stdscr, filename):
                     start_row = 0
                     selected_row = 0
                 elif result == 'row_details':
-                    if 0 <= selected_row < len(sorted_data):
-                        row_details_popup(stdscr, sorted_data[selected_row])
+                    if 0 <= selected_row < len(view):
+                        row_details_popup(stdscr, data[view[selected_row]])
                 elif result == 'quit':
                     break
             continue
         if key in (ord('q'), ord('Q')):
             break
-        elif key == curses.KEY_DOWN:
-            if selected_row < len(sorted_data) - 1:
-                selected_row += 1
-        elif key == curses.KEY_UP:
-            if selected_row > 0:
-                selected_row -= 1
-        elif key == curses.KEY_NPAGE:  # Page Down
-            selected_row = min(selected_row + (height - 2), len(sorted_data) - 1)
-        elif key == curses.KEY_PPAGE:  # Page Up
-            selected_row = max(selected_row - (height - 2), 0)
+        elif key in NAV_KEYS:
+            # Apply every navigation key already queued (e.g. a held-down arrow)
+            # before drawing again, instead of redrawing once per repeat
+            stdscr.nodelay(True)
+            while key in NAV_KEYS:
+                selected_row = move_selection(key, selected_row, len(view), height - 2)
+                key = stdscr.getch()
+            stdscr.nodelay(False)
+            if key != -1:
+                curses.ungetch(key)  # Handle it on the next pass, after drawing
         elif key in (ord('h'), ord('H')):
             visible_columns = column_menu(stdscr, all_columns, visible_columns.copy())
             if not visible_columns:
@@ -583,49 +800,50 @@ def main(stdscr, filename):
             selected_row = 0
         elif key == ord('e'):
             filename = export_prompt(stdscr, 'export.sqlite3')
-            export_to_sqlite3(filename, visible_columns, sorted_data)
-            stdscr.clear()
+            export_to_sqlite3(filename, visible_columns, [data[r] for r in view])
+            stdscr.erase()
             stdscr.addstr(0, 0, f"Exported to {filename}")
             stdscr.addstr(1, 0, "Press any key to continue...")
             stdscr.getch()
         elif key == ord('x'):
             filename = export_csv_prompt(stdscr, 'export.csv')
-            export_to_csv(filename, visible_columns, sorted_data)
-            stdscr.clear()
+            export_to_csv(filename, visible_columns, [data[r] for r in view])
+            stdscr.erase()
             stdscr.addstr(0, 0, f"Exported to {filename}")
             stdscr.addstr(1, 0, "Press any key to continue...")
             stdscr.getch()
         elif key in (ord('d'), 10, 13):  # 'd' or Enter
-            if 0 <= selected_row < len(sorted_data):
-                row_details_popup(stdscr, sorted_data[selected_row])
+            if 0 <= selected_row < len(view):
+                row_details_popup(stdscr, data[view[selected_row]])
         elif key == ord('c'):
-            if 0 <= selected_row < len(sorted_data):
+            if 0 <= selected_row < len(view):
                 if HAS_PYPERCLIP:
-                    pyperclip.copy(json.dumps(sorted_data[selected_row], indent=2, ensure_ascii=False))
-                    stdscr.clear()
+                    pyperclip.copy(dumps_pretty(data[view[selected_row]]))
+                    stdscr.erase()
                     stdscr.addstr(0, 0, "Row copied to clipboard!")
                     stdscr.addstr(1, 0, "Press any key to continue...")
                     stdscr.getch()
                 else:
-                    stdscr.clear()
+                    stdscr.erase()
                     stdscr.addstr(0, 0, "pyperclip not installed. Run 'pip install pyperclip' and try again.")
                     stdscr.addstr(1, 0, "Press any key to continue...")
                     stdscr.getch()
         elif key == ord('b'):
-            if 0 <= selected_row < len(sorted_data):
-                h = row_hash(sorted_data[selected_row])
+            if 0 <= selected_row < len(view):
+                h = row_hashes[view[selected_row]]
                 if h in bookmarks:
                     bookmarks.remove(h)
                 else:
                     bookmarks.add(h)
+                bookmarks_version += 1
         elif key == ord('B'):
             # Jump to next bookmark
-            if bookmarks and len(sorted_data) > 0:
-                current = row_hash(sorted_data[selected_row]) if 0 <= selected_row < len(sorted_data) else None
+            if bookmarks and len(view) > 0:
+                current = row_hashes[view[selected_row]] if 0 <= selected_row < len(view) else None
                 found = False
-                for offset in range(1, len(sorted_data)+1):
-                    idx = (selected_row + offset) % len(sorted_data)
-                    if row_hash(sorted_data[idx]) in bookmarks:
+                for offset in range(1, len(view)+1):
+                    idx = (selected_row + offset) % len(view)
+                    if row_hashes[view[idx]] in bookmarks:
                         selected_row = idx
                         found = True
                         break